@@ -1,9 +1,14 @@
 # .github/scripts/fetch_data.py
 import os
+import json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import sys
 import fnmatch
+from urllib.parse import quote
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import logging
 
@@ -11,6 +16,131 @@ import logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Concurrent file downloads; kept small to stay well within GitHub's per-host limits.
+# This is the single concurrency limit: it caps both download threads and pooled connections.
+MAX_WORKERS = 8
+
+# Bytes written per chunk when streaming a download to disk
+DOWNLOAD_CHUNK_SIZE = 128 * 1024
+
+# Sidecar of ETags from previous runs, keyed by repo path for files and by URL for listings
+ETAG_CACHE_PATH = os.path.join("data", ".etags.json")
+
+# Directory listings from previous runs, keyed by listing URL. Only name/path/type of
+# entries matching the download patterns are kept, so the committed cache exposes
+# nothing from the private repo beyond the files this script already publishes.
+LISTING_CACHE_FIELDS = ('name', 'path', 'type')
+LISTING_CACHE_PATH = os.path.join("data", ".listing.json")
+
+def _load_cache(path):
+    """Load a JSON cache file, or an empty mapping if there is none."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def _save_cache(path, data):
+    """Write a JSON cache file."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+def _create_session(headers):
+    """Build a pooled, retrying session so all GitHub requests reuse kept-alive connections."""
+    session = requests.Session()
+    # Retry transient errors and rate limiting with exponential backoff (0.5s, 1s, 2s, ...);
+    # urllib3 honors Retry-After on 429/503 responses
+    retries = Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(['GET']),
+    )
+    # One kept-alive connection per download worker, so threads never wait on the pool
+    session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=MAX_WORKERS, max_retries=retries))
+    session.headers.update(headers)
+    return session
+
+def _matches_patterns(file, patterns):
+    """Check whether a listing entry is a file matching any of the glob patterns."""
+    return file['type'] == 'file' and any(fnmatch.fnmatch(file['name'], pat) for pat in patterns)
+
+def _list_directory(session, url, etags, patterns):
+    """
+    List a repo directory via the contents API.
+
+    The request is conditional; on a 304 the listing cached by the previous
+    run is reused instead of being fetched and parsed again. The contents API
+    does not paginate directory listings, so a single request is enough.
+    Only entries matching the patterns are cached.
+    """
+    listings = _load_cache(LISTING_CACHE_PATH)
+    request_headers = {}
+    if url in listings and etags.get(url):
+        request_headers['If-None-Match'] = etags[url]
+
+    response = session.get(url, headers=request_headers)
+    if response.status_code == 304:
+        logger.info("Directory listing unchanged (ETag match), using cached listing")
+        return listings[url]
+    response.raise_for_status()
+
+    files = response.json()
+    etag = response.headers.get('ETag')
+    if etag:
+        etags[url] = etag
+        listings[url] = [
+            {key: file[key] for key in LISTING_CACHE_FIELDS}
+            for file in files if _matches_patterns(file, patterns)
+        ]
+        _save_cache(LISTING_CACHE_PATH, listings)
+    return files
+
+def _download_one(session, contents_url, file, download_headers, output_dir, etag=None):
+    """
+    Download a single file from the repo listing.
+
+    Returns (name, status, nbytes, etag), where status is 'downloaded',
+    'unchanged' or 'failed'.
+
+    If a cached ETag is given and the local copy exists, the request is made
+    conditional; a 304 response leaves the local file untouched.
+    """
+    output_path = os.path.join(output_dir, file['name'])
+    temp_path = f"{output_path}.part"
+    try:
+        logger.info(f"Downloading {file['name']}...")
+        request_headers = dict(download_headers)
+        if etag and os.path.exists(output_path):
+            request_headers['If-None-Match'] = etag
+        # Fetch by path through the contents API; auth comes from the session headers
+        file_url = f"{contents_url}/{quote(file['path'])}"
+        with session.get(file_url, headers=request_headers, stream=True) as file_response:
+            if file_response.status_code == 304:
+                logger.info(f"  ✅ {file['name']} unchanged (ETag match)")
+                return file['name'], 'unchanged', 0, etag
+            file_response.raise_for_status()
+
+            # Stream the raw bytes straight to disk; a temp file keeps a failed
+            # transfer from leaving a truncated copy behind a cached ETag
+            nbytes = 0
+            with open(temp_path, 'wb') as f:
+                for chunk in file_response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+                    nbytes += len(chunk)
+            os.replace(temp_path, output_path)
+
+        logger.info(f"  ✅ Saved {file['name']} ({nbytes} bytes)")
+        return file['name'], 'downloaded', nbytes, file_response.headers.get('ETag')
+
+    except requests.exceptions.RequestException as e:
+        logger.info(f"  ❌ Failed to download {file['name']}: {e}")
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        return file['name'], 'failed', 0, None
+
 def fetch_files_from_repo(get_type):
     """Fetch files from the repo based on the get_type argument."""
     token = os.environ.get('PRIVATE_REPO_TOKEN')
@@ -38,83 +168,70 @@ def fetch_files_from_repo(get_type):
         logger.error("ERROR: Invalid --get argument. Use 'summaries' or 'html'.")
         sys.exit(1)
 
-    try:
-        # List files in the target directory
-        url = f"https://api.github.com/repos/{repo}/contents/{directory}"
-        logger.info(f"Listing files in {repo}/{directory}/")
-
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-
-        files = response.json()
-
-        # Find all files matching the patterns
-        matching_files = []
-        for file in files:
-            if file['type'] == 'file' and any(fnmatch.fnmatch(file['name'], pat) for pat in patterns):
-                matching_files.append(file)
-
-        if not matching_files:
-            logger.error(f"ERROR: No files matching {patterns} found in {directory}/ directory")
-            logger.error("Available files:")
-            for file in files:
-                if file['type'] == 'file':
-                    logger.error(f"  - {file['name']}")
-            sys.exit(1)
-
-        logger.info(f"Found {len(matching_files)} matching files to download:")
-        for file in matching_files:
-            logger.info(f"  - {file['name']}")
-
-        # Ensure output directory exists
-        os.makedirs(output_dir, exist_ok=True)
-
-        # Download headers for raw file content
-        download_headers = {
-            'Authorization': f'Bearer {token}',
-            'Accept': 'application/vnd.github.v3.raw',
-            'X-GitHub-Api-Version': '2022-11-28'
-        }
-
-        # Download each matching file
-        downloaded_files = []
-        for file in matching_files:
-            try:
-                logger.info(f"Downloading {file['name']}...")
-                file_response = requests.get(file['download_url'], headers=download_headers)
-                file_response.raise_for_status()
-
-                output_path = os.path.join(output_dir, file['name'])
-                # Use binary mode for images, text mode for others
-                if any(file['name'].lower().endswith(ext) for ext in ['.png', '.jpg', '.jpeg', '.gif', '.svg', '.webp']):
-                    with open(output_path, 'wb') as f:
-                        f.write(file_response.content)
-                else:
-                    with open(output_path, 'w', encoding='utf-8') as f:
-                        f.write(file_response.text)
-
-                downloaded_files.append(file['name'])
-                logger.info(f"  ✅ Saved {file['name']} ({len(file_response.content)} bytes)")
-
-            except requests.exceptions.RequestException as e:
-                logger.info(f"  ❌ Failed to download {file['name']}: {e}")
-                continue
-
-        if downloaded_files:
-            logger.info(f"\n✅ Successfully downloaded {len(downloaded_files)} files:")
-            for filename in downloaded_files:
-                logger.info(f"   - {output_dir}/{filename}")
-        else:
-            logger.error("❌ No files were successfully downloaded")
+    with _create_session(headers) as session:
+        try:
+            # List files in the target directory
+            contents_url = f"https://api.github.com/repos/{repo}/contents"
+            url = f"{contents_url}/{directory}"
+            logger.info(f"Listing files in {repo}/{directory}/")
+
+            etags = _load_cache(ETAG_CACHE_PATH)
+            files = _list_directory(session, url, etags, patterns)
+
+            # Find all files matching the patterns
+            matching_files = [file for file in files if _matches_patterns(file, patterns)]
+
+            if not matching_files:
+                logger.error(f"ERROR: No files matching {patterns} found in {directory}/ directory")
+                logger.error("Available files:")
+                for file in files:
+                    if file['type'] == 'file':
+                        logger.error(f"  - {file['name']}")
+                sys.exit(1)
+
+            logger.info(f"Found {len(matching_files)} matching files to download:")
+            for file in matching_files:
+                logger.info(f"  - {file['name']}")
+
+            # Ensure output directory exists
+            os.makedirs(output_dir, exist_ok=True)
+
+            # Raw file content; auth and API version come from the session headers
+            download_headers = {'Accept': 'application/vnd.github.v3.raw'}
+
+            # Download matching files concurrently; each worker writes its own path
+            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+                results = list(executor.map(
+                    lambda f: _download_one(session, contents_url, f, download_headers, output_dir, etags.get(f['path'])),
+                    matching_files
+                ))
+            downloaded_files = [name for name, status, _, _ in results if status == 'downloaded']
+            unchanged_files = [name for name, status, _, _ in results if status == 'unchanged']
+
+            for file, (_, status, _, etag) in zip(matching_files, results):
+                if status != 'failed' and etag:
+                    etags[file['path']] = etag
+            _save_cache(ETAG_CACHE_PATH, etags)
+
+            if downloaded_files:
+                logger.info(f"\n✅ Successfully downloaded {len(downloaded_files)} files:")
+                for filename in downloaded_files:
+                    logger.info(f"   - {output_dir}/{filename}")
+            if unchanged_files:
+                logger.info(f"\n✅ {len(unchanged_files)} files unchanged since last run:")
+                for filename in unchanged_files:
+                    logger.info(f"   - {output_dir}/{filename}")
+            if not downloaded_files and not unchanged_files:
+                logger.error("❌ No files were successfully downloaded")
+                sys.exit(1)
+
+        except requests.exceptions.RequestException as e:
+            logger.error(f"ERROR: Failed to fetch file list: {e}")
+            if hasattr(e, 'response') and e.response is not None:
+                logger.error(f"Response status: {e.response.status_code}")
+                logger.error(f"Response body: {e.response.text[:500]}")
             sys.exit(1)
 
-    except requests.exceptions.RequestException as e:
-        logger.error(f"ERROR: Failed to fetch file list: {e}")
-        if hasattr(e, 'response') and e.response is not None:
-            logger.error(f"Response status: {e.response.status_code}")
-            logger.error(f"Response body: {e.response.text[:500]}")
-        sys.exit(1)
-
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Fetch files from a private GitHub repo.")
     parser.add_argument('--get', choices=['summaries', 'html'], required=True, help="What to fetch: 'summaries' or 'html'")
@@ -23,6 +23,11 @@ USAGE:
 
     If output_file is omitted, overwrites the input file.
 
+    Loading and saving use orjson when it is installed (pip install orjson),
+    falling back to the standard json module otherwise. When ijson is
+    installed (pip install ijson), features are streamed one at a time so
+    peak memory tracks a single feature rather than the whole file.
+
 EXAMPLE:
     # Download new file from Census Bureau, then:
     python3 scripts/clean_census_geojson.py \
@@ -30,16 +35,83 @@ EXAMPLE:
         docs/data/us_congressional_districts.geojson
 """
 
+import itertools
 import json
 import sys
 import os
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Essential Census Bureau properties to keep
+ESSENTIAL_PROPS = frozenset({
+    'STATEFP',      # State FIPS code
+    'CD119FP', 'CD120FP', 'CD121FP', 'CD118FP',  # District number (varies by Congress)
+    'GEOIDFQ',      # Full GEOID
+    'GEOID',        # Short GEOID (used for data joins)
+    'NAMELSAD',     # Full name
+    'LSAD',         # Legal/Statistical Area Description
+    'CDSESSN',      # Congressional session number
+    'ALAND',        # Land area
+    'AWATER'        # Water area
+})
+
+# Standard CRS written to the cleaned output
+CRS = {
+    'type': 'name',
+    'properties': {'name': 'urn:ogc:def:crs:EPSG::4269'}
+}
+
+
+def load_json(path):
+    """Parse a JSON file, using orjson when available."""
+    with open(path, 'rb') as f:
+        if orjson is not None:
+            return orjson.loads(f.read())
+        return json.load(f)
+
+
+def dumps_json(data):
+    """Serialize data to JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode('utf-8')
+
+
+def read_features(path):
+    """
+    Return (collection type, feature iterator) for a GeoJSON file.
+
+    With ijson the features are streamed from disk; otherwise the whole
+    file is parsed up front.
+    """
+    if ijson is None:
+        data = load_json(path)
+        return data.get('type'), iter(data.get('features', []))
+
+    with open(path, 'rb') as f:
+        collection_type = next(ijson.items(f, 'type'), None)
+    return collection_type, _stream_features(path)
+
+
+def _stream_features(path):
+    with open(path, 'rb') as f:
+        yield from ijson.items(f, 'features.item', use_float=True)
+
 
 def calculate_winding(coords):
     """
     Calculate signed area to determine winding order.
     Negative = counterclockwise (CCW), Positive = clockwise (CW)
     D3.js expects CW for exterior rings.
+    Only x/y are read, so 3D rings can be passed as-is.
     """
     total = 0
     for i in range(len(coords) - 1):
@@ -50,21 +122,39 @@ def calculate_winding(coords):
 
 
 def strip_elevation(coords):
-    """Recursively strip 3rd coordinate (elevation) from all coordinates."""
+    """
+    Recursively strip 3rd coordinate (elevation) from all coordinates.
+    Rings are sliced point by point in one comprehension rather than recursing per point.
+    """
     if isinstance(coords[0], (int, float)):
         return coords[:2]
+    if isinstance(coords[0][0], (int, float)):
+        return [p[:2] for p in coords]
     return [strip_elevation(c) for c in coords]
 
 
 def reverse_rings(geometry):
-    """Reverse all polygon rings to flip winding order from CCW to CW."""
+    """Reverse all polygon rings in place to flip winding order from CCW to CW."""
     if geometry['type'] == 'Polygon':
-        geometry['coordinates'] = [ring[::-1] for ring in geometry['coordinates']]
+        for ring in geometry['coordinates']:
+            ring.reverse()
     elif geometry['type'] == 'MultiPolygon':
-        geometry['coordinates'] = [[ring[::-1] for ring in poly] for poly in geometry['coordinates']]
+        for poly in geometry['coordinates']:
+            for ring in poly:
+                ring.reverse()
     return geometry
 
 
+def first_point(geometry):
+    """Return the first coordinate of a Polygon/MultiPolygon, or [] for other types."""
+    coords = geometry['coordinates']
+    if geometry['type'] == 'Polygon':
+        return coords[0][0] if coords[0] else []
+    if geometry['type'] == 'MultiPolygon':
+        return coords[0][0][0] if coords[0][0] else []
+    return []
+
+
 def needs_winding_fix(geometry):
     """Check if the geometry has counterclockwise winding (needs fix)."""
     if geometry['type'] == 'Polygon':
@@ -91,96 +181,81 @@ def clean_geojson(input_path, output_path=None):
         output_path = input_path
 
     print(f"Loading {input_path}...")
-    with open(input_path, 'r') as f:
-        data = json.load(f)
+    collection_type, features = read_features(input_path)
 
-    if data.get('type') != 'FeatureCollection':
+    if collection_type != 'FeatureCollection':
         print("ERROR: Input file is not a GeoJSON FeatureCollection")
         sys.exit(1)
 
-    feature_count = len(data.get('features', []))
-    print(f"Processing {feature_count} features...")
-
-    # Check if winding fix is needed (sample first feature)
-    if data['features']:
-        sample_geom = data['features'][0]['geometry']
-        # Check after stripping elevation
-        sample_coords = strip_elevation(sample_geom['coordinates'])
-        temp_geom = {'type': sample_geom['type'], 'coordinates': sample_coords}
-        fix_winding = needs_winding_fix(temp_geom)
+    # Census files are homogeneous, so winding is decided once from the first
+    # feature (prefetched) and applied to every feature. Its dimensionality is
+    # only used to report coords_fixed; elevation is always stripped.
+    was_3d = False
+    fix_winding = False
+    first_feature = next(features, None)
+    if first_feature is not None:
+        was_3d = len(first_point(first_feature['geometry'])) > 2
+        # Winding only reads x/y, so elevation need not be stripped first
+        fix_winding = needs_winding_fix(first_feature['geometry'])
         if fix_winding:
             print("  - Winding order: CCW detected, will convert to CW")
         else:
             print("  - Winding order: Already CW (OK)")
+        features = itertools.chain([first_feature], features)
 
-    # Essential Census Bureau properties to keep
-    essential_props = [
-        'STATEFP',      # State FIPS code
-        'CD119FP', 'CD120FP', 'CD121FP', 'CD118FP',  # District number (varies by Congress)
-        'GEOIDFQ',      # Full GEOID
-        'GEOID',        # Short GEOID (used for data joins)
-        'NAMELSAD',     # Full name
-        'LSAD',         # Legal/Statistical Area Description
-        'CDSESSN',      # Congressional session number
-        'ALAND',        # Land area
-        'AWATER'        # Water area
-    ]
-
-    coords_fixed = 0
+    feature_count = 0
+    sample = None
     winding_fixed = 0
     props_cleaned = 0
 
-    for feature in data['features']:
-        # 1. Strip elevation from coordinates
-        original_coords = feature['geometry']['coordinates']
-        feature['geometry']['coordinates'] = strip_elevation(original_coords)
-
-        # Check if coords were 3D
-        if feature['geometry']['type'] == 'Polygon':
-            sample = original_coords[0][0] if original_coords[0] else []
-        elif feature['geometry']['type'] == 'MultiPolygon':
-            sample = original_coords[0][0][0] if original_coords[0][0] else []
-        else:
-            sample = []
+    # Measure before writing, since the output may replace the input
+    input_size = os.path.getsize(input_path)
 
-        if len(sample) > 2:
-            coords_fixed += 1
-
-        # 2. Fix winding order if needed
-        if fix_winding:
-            feature['geometry'] = reverse_rings(feature['geometry'])
-            winding_fixed += 1
-
-        # 3. Clean properties (remove KML cruft)
-        original_prop_count = len(feature['properties'])
-        feature['properties'] = {
-            k: v for k, v in feature['properties'].items()
-            if k in essential_props
-        }
-        if len(feature['properties']) < original_prop_count:
-            props_cleaned += 1
-
-    # Set standard CRS
-    data['crs'] = {
-        'type': 'name',
-        'properties': {'name': 'urn:ogc:def:crs:EPSG::4269'}
-    }
+    # Features are written as they are cleaned; a temp file keeps in-place runs
+    # from truncating the input while it is still being read
+    print(f"Processing features and saving to {output_path}...")
+    temp_path = f"{output_path}.tmp"
+    with open(temp_path, 'wb') as out:
+        out.write(b'{"type":"FeatureCollection","crs":' + dumps_json(CRS) + b',"features":[')
+
+        for feature in features:
+            # 1. Strip elevation from coordinates
+            feature['geometry']['coordinates'] = strip_elevation(feature['geometry']['coordinates'])
+
+            # 2. Fix winding order if needed
+            if fix_winding:
+                feature['geometry'] = reverse_rings(feature['geometry'])
+                winding_fixed += 1
+
+            # 3. Clean properties (remove KML cruft)
+            if not feature['properties'].keys() <= ESSENTIAL_PROPS:
+                feature['properties'] = {
+                    k: v for k, v in feature['properties'].items()
+                    if k in ESSENTIAL_PROPS
+                }
+                props_cleaned += 1
+
+            if feature_count:
+                out.write(b',')
+            else:
+                sample = feature
+            out.write(dumps_json(feature))
+            feature_count += 1
+
+        out.write(b']}')
+
+    os.replace(temp_path, output_path)
+    coords_fixed = feature_count if was_3d else 0
 
     # Summary
-    print(f"\nTransformations applied:")
+    print(f"\nTransformations applied ({feature_count} features):")
     print(f"  - Coordinates fixed (3D→2D): {coords_fixed}")
     print(f"  - Winding order fixed: {winding_fixed}")
     print(f"  - Properties cleaned: {props_cleaned}")
 
-    # Save
-    print(f"\nSaving to {output_path}...")
-    with open(output_path, 'w') as f:
-        json.dump(data, f)
-
     # File size comparison
-    input_size = os.path.getsize(input_path)
     output_size = os.path.getsize(output_path)
-    print(f"File size: {output_size:,} bytes ({output_size/1024/1024:.2f} MB)")
+    print(f"\nFile size: {output_size:,} bytes ({output_size/1024/1024:.2f} MB)")
 
     if input_path != output_path:
         reduction = (1 - output_size/input_size) * 100
@@ -188,19 +263,21 @@ def clean_geojson(input_path, output_path=None):
 
     print("\nDone! The GeoJSON is now ready for D3.js.")
 
-    # Verify
+    # Verify against the first cleaned feature still in memory; a full
+    # round-trip reload of the output only runs with GEOJSON_VERIFY=1
     print("\n--- Verification ---")
-    with open(output_path, 'r') as f:
-        verify = json.load(f)
+    if sample is None:
+        print("No features to verify")
+        return
+
+    if os.environ.get('GEOJSON_VERIFY') == '1':
+        written = load_json(output_path)['features'][0]
+        print(f"Round-trip check: {'OK' if written == sample else 'MISMATCH (ERROR!)'}")
 
-    sample = verify['features'][0]
     print(f"Sample feature GEOID: {sample['properties'].get('GEOID')}")
     print(f"Sample properties: {list(sample['properties'].keys())}")
 
-    if sample['geometry']['type'] == 'MultiPolygon':
-        coord = sample['geometry']['coordinates'][0][0][0]
-    else:
-        coord = sample['geometry']['coordinates'][0][0]
+    coord = first_point(sample['geometry'])
     print(f"Sample coordinate: {coord} ({len(coord)}D)")
 
     winding = calculate_winding(